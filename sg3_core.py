@@ -19,8 +19,16 @@ PROGRAMMER NOTES:
 
 from os import path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
 from pathlib import Path
+import heapq
+import multiprocessing
+import os
+import shutil
+import sqlite3
 import string
+import tempfile
 
 # constant for extension checking
 file_extension = "txt"
@@ -224,47 +232,357 @@ def generate_file_summary(all_wordlists):
 # ------------------------------------------------------------------------------------
 # SG2 Concordance functions preserved EXACTLY; print removed where needed
 # ------------------------------------------------------------------------------------
-def build_Concordance(all_wordlists, ignore_Words):
+def _concordance_Key(word):
+    """
+    Hyphen-aware sort key used for every concordance listing.
+    Hyphenated words sort before any longer word sharing the same prefix.
+    """
+    return word.replace("-", "\x00")
+
+
+class ConcordanceStore:
+    """
+    Disk-backed concordance: word → [(file#, line#, word#)] kept in SQLite.
+
+    Postings are buffered in memory and spilled to the database in one
+    transaction whenever `flush_every_postings` postings are waiting.
+    Lookups and sorted iteration give the same results as the dict
+    returned by the in-memory build_Concordance.
+
+    Each row also stores _concordance_Key(word) as a UTF-8 BLOB, whose
+    plain byte order is the hyphen-aware order, so SQLite sorts without
+    calling back into Python.
+
+    If no db_path is given a temporary file is used and removed on close().
+    """
+
+    def __init__(self, db_path=None, flush_every_postings=100000):
+        """
+        flush_every_postings is a posting count, not a byte size: it is
+        the number of (word, file#, line#, word#) postings held in RAM
+        before they are written to disk.
+        """
+        if flush_every_postings < 1:
+            raise ValueError("flush_every_postings must be at least 1.")
+
+        self._owns_file = db_path is None
+        if self._owns_file:
+            fd, db_path = tempfile.mkstemp(prefix="sg3_concordance_", suffix=".db")
+            os.close(fd)
+
+        self.db_path = db_path
+        self.flush_every_postings = flush_every_postings
+        self._buffer = []
+
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " seq INTEGER PRIMARY KEY,"
+            " sort_key BLOB NOT NULL,"
+            " word TEXT NOT NULL,"
+            " file_no INTEGER, line_no INTEGER, word_no INTEGER)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(word):
+        return _concordance_Key(word).encode("utf-8")
+
+    def clear(self):
+        """Remove every posting, e.g. before building into a reused db_path."""
+        self._buffer = []
+        with self._conn:
+            self._conn.execute("DROP INDEX IF EXISTS idx_sort_key")
+            self._conn.execute("DELETE FROM postings")
+
+    def add(self, word, location):
+        """Queue one (file#, line#, word#) posting for word."""
+        self._buffer.append((self._key(word), word) + tuple(location))
+        if len(self._buffer) >= self.flush_every_postings:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered postings to disk in a single transaction."""
+        if not self._buffer:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO postings (sort_key, word, file_no, line_no, word_no)"
+                " VALUES (?, ?, ?, ?, ?)",
+                self._buffer
+            )
+        self._buffer = []
+
+    def _prepare_reads(self):
+        # The index is built once, after the bulk inserts, rather than
+        # being maintained row by row while the concordance is filled.
+        # It covers every column so sorted_items() never touches the table.
+        self.flush()
+        with self._conn:
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sort_key ON postings"
+                " (sort_key, seq, word, file_no, line_no, word_no)"
+            )
+
+    def __getitem__(self, word):
+        self._prepare_reads()
+        rows = self._conn.execute(
+            "SELECT file_no, line_no, word_no FROM postings WHERE sort_key = ? AND word = ?"
+            " ORDER BY seq",
+            (self._key(word), word)
+        ).fetchall()
+        if not rows:
+            raise KeyError(word)
+        return rows
+
+    def __contains__(self, word):
+        self._prepare_reads()
+        row = self._conn.execute(
+            "SELECT 1 FROM postings WHERE sort_key = ? AND word = ? LIMIT 1",
+            (self._key(word), word)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        self._prepare_reads()
+        return self._conn.execute(
+            "SELECT COUNT(DISTINCT word) FROM postings"
+        ).fetchone()[0]
+
+    def keys(self):
+        """Distinct words in hyphen-aware sorted order."""
+        self._prepare_reads()
+        cursor = self._conn.execute(
+            "SELECT word FROM postings GROUP BY sort_key, word ORDER BY sort_key"
+        )
+        for (word,) in cursor:
+            yield word
+
+    def __iter__(self):
+        return self.keys()
+
+    def get(self, word, default=None):
+        try:
+            return self[word]
+        except KeyError:
+            return default
+
+    def sorted_items(self):
+        """
+        Yields (word, [(file#, line#, word#), ...]) in hyphen-aware order,
+        streaming from disk so only one word's postings are held at a time.
+        """
+        self._prepare_reads()
+        cursor = self._conn.execute(
+            "SELECT word, file_no, line_no, word_no FROM postings ORDER BY sort_key, seq"
+        )
+        current = None
+        locations = []
+        for word, f, l, w in cursor:
+            if word != current:
+                if current is not None:
+                    yield current, locations
+                current = word
+                locations = []
+            locations.append((f, l, w))
+        if current is not None:
+            yield current, locations
+
+    # dict-style alias so the store can stand in for build_Concordance's dict
+    items = sorted_items
+
+    def close(self):
+        """Close the database, deleting it if it was a temporary file."""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+        if self._owns_file:
+            os.remove(self.db_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _concordance_Postings(filename, file_Number, ignore_Words):
+    """
+    SG2 per-file concordance loop, shared by the serial and parallel builds.
+    Yields (word, (file#, line#, word#)) for every indexed word in filename.
+    """
+    with open(filename, "rt") as f:
+        line_Number = 0
+        for line in f:
+            line_Number += 1
+            line_words = line.split()
+            word_Number = 0
+            for word in line_words:
+                word_Number += 1
+                clean = word.strip("()[]{},?\\/!.'").lower()
+                if not clean or clean in ignore_Words:
+                    continue
+                yield clean, (file_Number, line_Number, word_Number)
+
+
+def _format_Locations(locations):
+    """Formats [(file#, line#, word#), ...] as 'f.l.w; f.l.w'."""
+    return "; ".join(f"{f}.{l}.{w}" for f, l, w in locations)
+
+
+def build_Concordance(all_wordlists, ignore_Words, store=None):
     """
     PURE SG2 LOGIC (no prints)
     Builds concordance structure: word → [(file#, line#, word#)]
+
+    Pass a ConcordanceStore as `store` to spill postings to disk instead
+    of keeping them all in RAM; the store is cleared first and returned.
     """
-    concordance = defaultdict(list)
-    file_Number = 1
+    if store is not None:
+        store.clear()
+        for file_Number, filename in enumerate(all_wordlists.keys(), start=1):
+            for clean, location in _concordance_Postings(filename, file_Number, ignore_Words):
+                store.add(clean, location)
+        store.flush()
+        return store
 
-    for filename in all_wordlists.keys():
-        with open(filename, "rt") as f:
-            line_Number = 0
-            for line in f:
-                line_Number += 1
-                line_words = line.split()
-                word_Number = 0
-                for word in line_words:
-                    word_Number += 1
-                    clean = word.strip("()[]{},?\/!.'").lower()
-                    if not clean or clean in ignore_Words:
-                        continue
-                    concordance[clean].append((file_Number, line_Number, word_Number))
-        file_Number += 1
+    concordance = defaultdict(list)
+    for file_Number, filename in enumerate(all_wordlists.keys(), start=1):
+        for clean, location in _concordance_Postings(filename, file_Number, ignore_Words):
+            concordance[clean].append(location)
 
     return concordance
 
 
-def create_Concordance_text(concordance, highlight_Words):
+# Below this many bytes of input the automatic corpus mode stays in-process;
+# starting worker processes would cost more than it saves.
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _build_Concordance_Shard(job):
     """
-    Returns the concordance output as a list of formatted lines.
-    GUI decides whether to show it or write to a file.
+    Worker for build_Corpus_Concordance.
+
+    Builds one file's concordance under its global file number and writes
+    it to a shard file, one 'word f.l.w; f.l.w' line per word in
+    hyphen-aware order. Only the shard path goes back to the parent.
     """
-    output_lines = []
-    sort_Words = sorted(concordance.keys(), key=lambda w: w.replace("-", "\x00"))
+    file_Number, filename, ignore_Words, shard_dir = job
+    partial = defaultdict(list)
+    for clean, location in _concordance_Postings(filename, file_Number, ignore_Words):
+        partial[clean].append(location)
+
+    shard = os.path.join(shard_dir, f"{file_Number}.shard")
+    with open(shard, "w", encoding="utf-8", newline="\n") as out:
+        for word in sorted(partial, key=_concordance_Key):
+            out.write(f"{word} {_format_Locations(partial[word])}\n")
+
+    return shard
+
+
+def _shard_Word(line):
+    return line[:line.index(" ")]
+
+
+def _merge_Concordance_Shards(shards, shard_dir):
+    """
+    K-way merges sorted shard files into (word, "f.l.w; f.l.w") pairs.
+    Owns shard_dir and deletes it once the merge is finished or closed.
+    """
+    try:
+        files = [open(shard, "r", encoding="utf-8", newline="\n") for shard in shards]
+        try:
+            # heapq.merge is stable, so equal words come out in file-number order
+            merged = heapq.merge(*files, key=lambda line: _concordance_Key(_shard_Word(line)))
+            for word, group in groupby(merged, key=_shard_Word):
+                skip = len(word) + 1
+                yield word, "; ".join(line[skip:-1] for line in group)
+        finally:
+            for f in files:
+                f.close()
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+
+
+def build_Corpus_Concordance(all_wordlists, ignore_Words, max_workers=None):
+    """
+    Corpus-wide concordance over every file in all_wordlists.
+
+    Each file is indexed in its own worker process before this returns,
+    so worker errors are raised here. File numbers follow the order of
+    all_wordlists, exactly like build_Concordance.
 
-    for word in sort_Words:
+    Returns a single-use iterator of (word, "f.l.w; f.l.w") pairs in
+    hyphen-aware order, for iter_Concordance_text. The sorted shards are
+    k-way merged off disk lazily as that iterator is consumed.
+
+    With max_workers=None the build stays in-process when there is only
+    one core, one file, or less than _PARALLEL_MIN_BYTES of input.
+    """
+    filenames = list(all_wordlists.keys())
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(filenames))
+        total_bytes = sum(os.path.getsize(f) for f in filenames)
+        if total_bytes < _PARALLEL_MIN_BYTES:
+            max_workers = 1
+
+    if max_workers <= 1 or len(filenames) <= 1:
+        concordance = build_Concordance(all_wordlists, ignore_Words)
+        return (
+            (word, _format_Locations(concordance[word]))
+            for word in sorted(concordance.keys(), key=_concordance_Key)
+        )
+
+    shard_dir = tempfile.mkdtemp(prefix="sg3_shards_")
+    try:
+        jobs = [
+            (file_Number, filename, ignore_Words, shard_dir)
+            for file_Number, filename in enumerate(filenames, start=1)
+        ]
+        # "spawn" so the workers never fork a running GUI process
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+            shards = list(pool.map(_build_Concordance_Shard, jobs))
+    except BaseException:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+        raise
+
+    return _merge_Concordance_Shards(shards, shard_dir)
+
+
+def iter_Concordance_text(concordance, highlight_Words):
+    """
+    Yields the concordance output one formatted line at a time, so a
+    ConcordanceStore can be written to a file without holding every line.
+
+    Accepts the dict from build_Concordance, a ConcordanceStore, or the
+    already-sorted stream from build_Corpus_Concordance.
+    """
+    if isinstance(concordance, ConcordanceStore):
+        sorted_items = (
+            (word, _format_Locations(locations))
+            for word, locations in concordance.sorted_items()
+        )
+    elif isinstance(concordance, dict):
+        sort_Words = sorted(concordance.keys(), key=_concordance_Key)
+        sorted_items = ((word, _format_Locations(concordance[word])) for word in sort_Words)
+    else:
+        sorted_items = concordance
+
+    for word, formatted in sorted_items:
         display_word = word.upper() if word in highlight_Words else word
-        locations = concordance[word]
-        formatted = "; ".join(f"{f}.{l}.{w}" for f, l, w in locations)
-        output_lines.append(f"{display_word} {formatted}.")
+        yield f"{display_word} {formatted}."
 
-    return output_lines
+
+def create_Concordance_text(concordance, highlight_Words):
+    """
+    Returns the concordance output as a list of formatted lines.
+    GUI decides whether to show it or write to a file.
+    """
+    return list(iter_Concordance_text(concordance, highlight_Words))
 
 
 def read_Extra_Lists(filename="ExtraLists.txt"):
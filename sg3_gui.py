@@ -13,7 +13,7 @@ Tkinter GUI for SG3 frontend. Uses sg3_core.py for logic.
 
   1) Open a text file (up to 10)
   2) Find a word in all open files (disabled until >=1 file)
-  3) Build concordance for ONE open file (disabled until >=1 file)
+  3) Build concordance for ONE open file, or ALL open files (disabled until >=1 file)
   4) Close ONE of the files (disabled until >=1 file)
   5) Quit program
   
@@ -31,7 +31,9 @@ from sg3_core import (
     getContent,
     countOccurrences,
     build_Concordance,
-    create_Concordance_text,
+    build_Corpus_Concordance,
+    ConcordanceStore,
+    iter_Concordance_text,
     read_Extra_Lists
 )
 
@@ -44,6 +46,9 @@ class SG3App(tk.Tk):
     BTN_MAIN = "#A8DADC"
     BTN_ACTIVE = "#DDA15E"
 
+    ALL_FILES = "All Open Files"
+    STORE_MIN_BYTES = 64 * 1024 * 1024   # larger files spill to a disk store
+
     def __init__(self):
         super().__init__()
 
@@ -90,7 +95,7 @@ class SG3App(tk.Tk):
             "This program allows you to:\n"
             " • Open up to 10 text files\n"
             " • Search for a word across all open files\n"
-            " • Build a concordance for any open file\n"
+            " • Build a concordance for any open file, or all of them\n"
             " • Close files at any time\n\n"
             "Press ENTER or close this window to continue."
         )
@@ -304,7 +309,7 @@ class SG3App(tk.Tk):
             font=("Arial", 18, "bold")
         ).pack(pady=20)
 
-        cb = ttk.Combobox(win, values=self.file_order, font=("Arial", 16))
+        cb = ttk.Combobox(win, values=[self.ALL_FILES] + self.file_order, font=("Arial", 16))
         cb.pack(pady=10)
 
         def build():
@@ -316,18 +321,43 @@ class SG3App(tk.Tk):
 
             ignore, highlight = read_Extra_Lists()
 
-            # FIXED: build_Concordance expects dict + ignore list
-            concord = build_Concordance(
-                {selected: self.open_files[selected]},
-                ignore
-            )
-
-            # FIXED: correct arg order: concord, highlight
-            lines = create_Concordance_text(concord, highlight)
-
-            outfile = selected + "_CONCORDANCE.txt"
-            with open(outfile, "w") as f:
-                f.write("\n".join(lines))
+            # Window is unresponsive while building; show a busy cursor
+            win.config(cursor="watch")
+            win.update_idletasks()
+
+            store = None
+            try:
+                if selected == self.ALL_FILES:
+                    # Corpus mode: big corpora are split across worker processes,
+                    # small ones stay in-process; files numbered in open order
+                    concord = build_Corpus_Concordance(
+                        {f: self.open_files[f] for f in self.file_order},
+                        ignore
+                    )
+                    outfile = "CORPUS_CONCORDANCE.txt"
+                else:
+                    if os.path.getsize(selected) >= self.STORE_MIN_BYTES:
+                        store = ConcordanceStore()
+
+                    # FIXED: build_Concordance expects dict + ignore list
+                    concord = build_Concordance(
+                        {selected: self.open_files[selected]},
+                        ignore,
+                        store=store
+                    )
+                    outfile = selected + "_CONCORDANCE.txt"
+
+                # FIXED: correct arg order: concord, highlight
+                # Lines are streamed to the file rather than collected first
+                with open(outfile, "w") as f:
+                    for i, line in enumerate(iter_Concordance_text(concord, highlight)):
+                        if i:
+                            f.write("\n")
+                        f.write(line)
+            finally:
+                if store is not None:
+                    store.close()
+                win.config(cursor="")
 
             messagebox.showinfo(
                 "Concordance Saved",